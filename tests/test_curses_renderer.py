@@ -0,0 +1,98 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+curses = pytest.importorskip("curses")
+
+import tetris
+
+
+class FakeScreen:
+    # Stands in for a curses window and records every string written to it
+    def __init__(self, rows=30, cols=80):
+        self.rows = rows
+        self.cols = cols
+        self.writes = []
+
+    def getmaxyx(self):
+        return self.rows, self.cols
+
+    def addstr(self, row, col, text, attr=0):
+        self.writes.append((row, col, text))
+
+    def nodelay(self, flag):
+        pass
+
+    def keypad(self, flag):
+        pass
+
+    def erase(self):
+        pass
+
+    def noutrefresh(self):
+        pass
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    monkeypatch.setattr(curses, "curs_set", lambda visibility: None)
+    monkeypatch.setattr(curses, "has_colors", lambda: False)
+    monkeypatch.setattr(curses, "doupdate", lambda: None)
+    return tetris.CursesRenderer(FakeScreen(), tetris.GRID_WIDTH, tetris.GRID_HEIGHT)
+
+
+def empty_grid():
+    grid = [['.' for _ in range(tetris.GRID_WIDTH)] for _ in range(tetris.GRID_HEIGHT)]
+    color_grid = [[None for _ in range(tetris.GRID_WIDTH)] for _ in range(tetris.GRID_HEIGHT)]
+    return grid, color_grid
+
+
+def draw_frame(renderer, offset, with_info=True):
+    grid, color_grid = empty_grid()
+    renderer.clear()
+    renderer.draw_grid(grid, color_grid, None)
+    renderer.draw_block({'shape': [[1]], 'color': (255, 0, 0)}, offset)
+    if with_info:
+        renderer.draw_player_info("bob", 0, 0)
+    renderer.present()
+    writes = renderer.stdscr.writes
+    renderer.stdscr.writes = []
+    return writes
+
+
+def test_unchanged_frame_writes_nothing(renderer):
+    draw_frame(renderer, [3, 4])
+    assert draw_frame(renderer, [3, 4]) == []
+
+
+def test_moved_block_writes_only_cells_it_left_and_entered(renderer):
+    draw_frame(renderer, [3, 4])
+    writes = draw_frame(renderer, [4, 4])
+    assert sorted(writes) == [(4, 7, ' .'), (4, 9, '[]')]
+
+
+def test_vanished_cells_are_blanked(renderer):
+    draw_frame(renderer, [3, 4])
+    writes = draw_frame(renderer, [3, 4], with_info=False)
+    assert sorted(writes) == [(9, renderer.panel_col, ' ' * 20),
+                              (11, renderer.panel_col, ' ' * 20),
+                              (13, renderer.panel_col, ' ' * 20)]
+
+
+def test_too_small_terminal_exits_with_message(monkeypatch):
+    monkeypatch.setattr(curses, "curs_set", lambda visibility: None)
+    monkeypatch.setattr(curses, "has_colors", lambda: False)
+    with pytest.raises(SystemExit, match="Terminal too small"):
+        tetris.CursesRenderer(FakeScreen(rows=10, cols=40), tetris.GRID_WIDTH, tetris.GRID_HEIGHT)
+
+
+def test_incomplete_renderer_cannot_be_constructed():
+    class DrawOnlyRenderer(tetris.Renderer):
+        def clear(self):
+            pass
+
+    with pytest.raises(TypeError):
+        DrawOnlyRenderer()
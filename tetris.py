@@ -5,6 +5,11 @@ import random
 import time
 import datetime
 import csv
+from abc import ABC, abstractmethod
+try:
+    import curses
+except ImportError:
+    curses = None  # Not shipped with Python on Windows, only needed for the terminal renderer
 
 # Some information for game rules is taken from :-  https://tetris.wiki/Scoring
 
@@ -72,20 +77,534 @@ class HighestStreak:
         self.username = username
         self.streak = streak
         self.total_time = total_time
-    
-class Tetris:
-    def __init__(self):
+
+# Every rendering backend implements this interface so the game loop never talks to a display library directly.
+class Renderer(ABC):
+    # True only for PygameRenderer, whose `screen` surface the pygame menus in Tetris draw on directly
+    graphical = False
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    @abstractmethod
+    def draw_grid(self, grid, color_grid, current_color):
+        pass
+
+    @abstractmethod
+    def draw_block(self, block, offset):
+        pass
+
+    @abstractmethod
+    def draw_next_block(self, block):
+        pass
+
+    @abstractmethod
+    def draw_player_info(self, player_name, points, level):
+        pass
+
+    @abstractmethod
+    def present(self):
+        pass
+
+    @abstractmethod
+    def poll_actions(self):
+        # Returns a list of actions: 'left', 'right', 'soft_drop', 'rotate', 'hard_drop' or 'quit'
+        pass
+
+    @abstractmethod
+    def get_ticks(self):
+        pass
+
+    @abstractmethod
+    def tick(self, fps):
+        pass
+
+    @abstractmethod
+    def ask_player_name(self):
+        # Returns the name typed by the player (never blank)
+        pass
+
+    @abstractmethod
+    def show_level_up(self, level):
+        pass
+
+    @abstractmethod
+    def show_mega_tetris(self):
+        pass
+
+    @abstractmethod
+    def show_game_over(self, points, level, survival_time):
+        # Returns True if the player wants to play again
+        pass
+
+class PygameRenderer(Renderer):
+    graphical = True
+
+    def __init__(self, width, height):
         pygame.mixer.init() 
         pygame.font.init()
+        self.width = width
+        self.height = height
+        self.screen_width = width * CELL_SIZE + 200  # Increased width for displaying next block and player info
+        self.screen_height = height * CELL_SIZE
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        pygame.display.set_caption('Tetris')
+        self.clock = pygame.time.Clock()
+        self.last_grid = None  # Arguments of the last draw_grid call, redrawn by fade_lines
+        self.sounds = [r"_internal\start_game.mp3", r"_internal\sound_track.mp3"]  # List of sounds to play in sequence
+        self.current_sound_index = 0
+
+    def clear(self):
+        self.screen.fill((0, 0, 0))
+
+    def draw_grid(self, grid, color_grid, current_color):
+        self.last_grid = (grid, color_grid, current_color)
+        for y in range(self.height):
+            for x in range(self.width):
+                if grid[y][x] == '.':
+                    # If the cell is empty, check if it contains a placed block with a color
+                    color = color_grid[y][x]
+                    if color is None:
+                        color = EMPTY_COLOR
+                else:
+                    color = color_grid[y][x] if color_grid[y][x] is not None else current_color
+                pygame.draw.rect(self.screen, color, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+                pygame.draw.rect(self.screen, GRID_COLOR, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+
+    def draw_block(self, block, offset):
+        for y, row in enumerate(block['shape']):
+            for x, cell in enumerate(row):
+                if cell != 0:
+                    color = block['color']
+                    pygame.draw.rect(self.screen, color, ((x + offset[0]) * CELL_SIZE, (y + offset[1]) * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+
+    def draw_next_block(self, block):
+        next_block_font = pygame.font.Font(None, 24)
+        next_block_text = next_block_font.render("Next Block:", True, (255, 255, 255))
+        next_block_rect = next_block_text.get_rect(center=(self.screen_width - 97, 50))
+        self.screen.blit(next_block_text, next_block_rect)
+
+        # Draw box border around the next block
+        pygame.draw.rect(self.screen, (255, 255, 255), (self.screen_width - 162, 100, 135, 153), 2)
+
+        # Draw next block shape
+        for y, row in enumerate(block['shape']):
+            for x, cell in enumerate(row):
+                if cell != 0:
+                    color = block['color']
+                    pygame.draw.rect(self.screen, color, ((x + self.width + 1.25) * CELL_SIZE + 20, (y + 3.25) * CELL_SIZE + 20, CELL_SIZE, CELL_SIZE))
+
+    def draw_player_info(self, player_name, points, level):
+        player_info_font = pygame.font.Font(None, 24)
+        player_name_text = player_info_font.render(f"Player: {player_name}", True, (255, 255, 255))
+        player_name_rect = player_name_text.get_rect(center=(self.screen_width - 100, 300))
+        self.screen.blit(player_name_text, player_name_rect)
+        player_score_text = player_info_font.render(f"Score: {points}", True, (255, 255, 255))
+        player_score_rect = player_score_text.get_rect(center=(self.screen_width - 100, 350))
+        self.screen.blit(player_score_text, player_score_rect)
+        level_text = player_info_font.render(f"Level: {level}", True, (255, 255, 255))
+        level_rect = level_text.get_rect(center=(self.screen_width - 100, 400))
+        self.screen.blit(level_text, level_rect)
+
+    def display_message(self, message):
+        message_font = pygame.font.Font(None, 72)
+        message_text = message_font.render(message, True, (255, 255, 255))
+        message_rect = message_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+        self.screen.blit(message_text, message_rect)
+        pygame.display.flip()
+
+    def present(self):
+        pygame.display.flip()
+
+    def poll_actions(self):
+        actions = []
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or event.type == pygame.K_ESCAPE:
+                actions.append('quit')
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT:
+                    actions.append('left')
+                elif event.key == pygame.K_RIGHT:
+                    actions.append('right')
+                elif event.key == pygame.K_DOWN:
+                    actions.append('soft_drop')
+                elif event.key == pygame.K_UP:
+                    actions.append('rotate')
+                elif event.key == pygame.K_END:
+                    actions.append('hard_drop')
+        return actions
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+    def tick(self, fps):
+        self.clock.tick(fps)
+
+    def start_music(self):
+        self.current_sound_index = 0
+        self.play_sound(loop=True)
+
+    def play_sound(self, loop=False):
+        pygame.mixer.music.load( self.sounds[self.current_sound_index] )
+        pygame.mixer.music.play(-1 if loop else 0)
+
+        # Increment current_sound_index for the next sound sequence
+        self.current_sound_index = (self.current_sound_index + 1) % len(self.sounds)
+
+    def ask_player_name(self):
+        input_font = pygame.font.Font(None, 36)
+        input_text = ""
+        while True:
+            self.screen.fill((0, 0, 0))
+            prompt_text = input_font.render("Enter Your Name:", True, (255, 255, 255))
+            prompt_rect = prompt_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+            self.screen.blit(prompt_text, prompt_rect)
+
+            input_rendered = input_font.render(input_text, True, (255, 255, 255))
+            input_rect = input_rendered.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 50))
+            self.screen.blit(input_rendered, input_rect)
+
+            pygame.display.flip()
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_RETURN:
+                        if input_text.strip():
+                            return input_text
+                    elif event.key == pygame.K_BACKSPACE:
+                        input_text = input_text[:-1]
+                    else:
+                        input_text += event.unicode
+
+    def fade_lines(self):
+        for i in range(255, 0, -10):
+            self.screen.fill((0, 0, 0))
+            if self.last_grid is not None:
+                self.draw_grid(*self.last_grid)
+            alpha_surface = pygame.Surface((self.screen_width, self.screen_height))
+            alpha_surface.set_alpha(i)
+            self.screen.blit(alpha_surface, (0, 0))
+            pygame.display.flip()
+            pygame.time.delay(50)
+
+    def show_level_up(self, level):
+        # Create particles
+        particles = []
+        num_particles = 100
+
+        for _ in range(num_particles):
+            x = random.randint(0, self.screen_width)
+            y = random.randint(0, self.screen_height)
+            color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+            particle = Particle(x, y, color)
+            particles.append(particle)
+
+        pygame.mixer.music.load(r"_internal\level_upgrade.mp3")
+        pygame.mixer.music.play()
+
+        duration = 2000  # milliseconds
+        start_time = pygame.time.get_ticks()
+        while ( pygame.time.get_ticks() - start_time < duration ) :
+            # Update particles
+            for particle in particles:
+                particle.update()
+            # Draw particles
+            self.screen.fill((0, 0, 0))  # Clear the screen
+            for particle in particles:
+                if particle.is_alive():
+                    particle.draw(self.screen)
+            self.display_message(f"Level {level} reached!")
+            pygame.display.flip()
+            pygame.time.delay(20)  # Delay between frames
+
+        self.fade_lines()
+        pygame.time.wait(600)
+        self.play_sound(loop=False)
+
+    def show_mega_tetris(self):
+        self.fade_lines()
+        pygame.mixer.music.load(r"_internal\mega_tetris_sound.mp3")
+        pygame.mixer.music.play(-1)
+        self.display_message("Mega Tetris!")
+        pygame.time.wait(2000)
+        self.play_sound(loop = False)
+
+    def show_game_over(self, points, level, survival_time):
+        game_over_font = pygame.font.Font(None, 72)
+        game_over_text = game_over_font.render("Game Over", True, (255, 255, 255) )
+        game_over_rect = game_over_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 90))
+
+        points_font = pygame.font.Font(None, 36)
+        points_text = points_font.render(f"Points: {points}", True, (255, 255, 255))
+        points_rect = points_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
+
+        survival_time_font = pygame.font.Font(None, 28)
+        survival_time_text = survival_time_font.render(f"Survival Time: {survival_time}", True, (255, 255, 255))
+        survival_time_rect = survival_time_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 60))
+
+        self.screen.fill(( 0 , 0 , 0 ))
+        self.screen.blit(game_over_text, game_over_rect)
+        self.screen.blit(survival_time_text, survival_time_rect) 
+        self.screen.blit(points_text, points_rect)
+        pygame.display.flip()
+        pygame.mixer.music.load(r"_internal\game_over.mp3")
+        pygame.mixer.music.play()
+
+        # Display level reached
+        level_font = pygame.font.Font(None, 34)
+        level_text = level_font.render(f"Level Reached: {level}", True, (255, 255, 255))
+        level_rect = level_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 105))
+        self.screen.blit(level_text, level_rect)
+
+        # Wait for a while before proceeding
+        text_font = pygame.font.Font(None, 28)
+        text = text_font.render(f"Press Escape to Return to Menu.", True, (255, 255, 0 ))
+        text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 145))
+        self.screen.blit(text, text_rect)
+        pygame.display.flip()
+
+        # Wait for user input to either return to menu or exit game
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return True
+                else :
+                # If the loop ends, it means the user didn't press Escape and wants to exit the game
+                    pygame.time.wait(5000)
+                    pygame.quit()
+                    return False
+
+# Text-mode backend for SSH sessions and machines without an SDL video driver.
+# Each frame is built in a back buffer and only the cells that differ from the previous frame are written to the terminal.
+class CursesRenderer(Renderer):
+    PALETTE = [((255, 0, 0), 'COLOR_RED'), ((0, 255, 0), 'COLOR_GREEN'), ((0, 0, 255), 'COLOR_BLUE'),
+               ((255, 255, 0), 'COLOR_YELLOW'), ((255, 0, 255), 'COLOR_MAGENTA'), ((0, 255, 255), 'COLOR_CYAN'),
+               ((255, 255, 255), 'COLOR_WHITE')]  # Black is left out so every block stays visible
+
+    def __init__(self, stdscr, width, height):
+        self.stdscr = stdscr
+        self.width = width
+        self.height = height
+        self.panel_col = width * 2 + 4  # Each grid cell is two terminal columns wide
+        self.min_rows = height + 1  # Grid plus its bottom border
+        self.min_cols = self.panel_col + 20  # Grid plus the player info panel
+        if self.terminal_too_small():
+            sys.exit(self.too_small_message())
+        self.front = {}  # (row, col) -> (text, attr) currently shown on the terminal
+        self.back = {}  # (row, col) -> (text, attr) of the frame being built
+        self.full_redraw = True
+        self.start_time = time.monotonic()
+        self.last_frame_time = self.start_time
+        self.keymap = {curses.KEY_LEFT: 'left', curses.KEY_RIGHT: 'right', curses.KEY_DOWN: 'soft_drop',
+                       curses.KEY_UP: 'rotate', curses.KEY_END: 'hard_drop', ord('q'): 'quit'}
+
+        stdscr.nodelay(True)
+        stdscr.keypad(True)
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+        self.has_colors = curses.has_colors()
+        if self.has_colors:
+            curses.start_color()
+            background = curses.COLOR_BLACK
+            try:
+                curses.use_default_colors()
+                background = -1
+            except curses.error:
+                pass
+            for pair, (_, name) in enumerate(self.PALETTE, start=1):
+                curses.init_pair(pair, getattr(curses, name), background)
+
+    def terminal_too_small(self):
+        rows, cols = self.stdscr.getmaxyx()
+        return rows < self.min_rows or cols < self.min_cols
+
+    def too_small_message(self):
+        return f"Terminal too small (need {self.min_rows}x{self.min_cols})."
+
+    def wait_for_terminal_size(self):
+        # Blocks until the terminal is large enough again; returns False if the player quits instead
+        self.stdscr.nodelay(False)
+        while self.terminal_too_small():
+            self.stdscr.erase()
+            self.write(0, 0, self.too_small_message())
+            self.write(1, 0, "Resize it or press q to quit.")
+            self.stdscr.refresh()
+            if self.stdscr.getch() == ord('q'):
+                self.stdscr.nodelay(True)
+                return False
+        self.stdscr.nodelay(True)
+        return True
+
+    def color_attr(self, color):
+        if not self.has_colors:
+            return curses.A_REVERSE
+        # Map any RGB colour (including the random ones from level 2 onwards) to the nearest terminal colour
+        distances = [sum((a - b) ** 2 for a, b in zip(color, rgb)) for rgb, _ in self.PALETTE]
+        pair = distances.index(min(distances)) + 1
+        return curses.color_pair(pair) | curses.A_REVERSE
+
+    def put(self, row, col, text, attr=0):
+        self.back[(row, col)] = (text, attr)
+
+    def put_cell(self, x, y, color):
+        if color is None:
+            self.put(y, x * 2 + 1, ' .', curses.A_DIM)
+        else:
+            self.put(y, x * 2 + 1, '[]', self.color_attr(color))
+
+    def write(self, row, col, text, attr=0):
+        try:
+            self.stdscr.addstr(row, col, text, attr)
+        except curses.error:
+            pass  # Writing the bottom-right cell moves the cursor off screen, which curses reports as an error
+
+    def clear(self):
+        self.back = {}
+
+    def draw_grid(self, grid, color_grid, current_color):
+        for y in range(self.height):
+            self.put(y, 0, '|')
+            self.put(y, self.width * 2 + 1, '|')
+            for x in range(self.width):
+                if grid[y][x] == '.':
+                    color = color_grid[y][x]
+                else:
+                    color = color_grid[y][x] if color_grid[y][x] is not None else current_color
+                self.put_cell(x, y, color)
+        self.put(self.height, 0, '+' + '-' * (self.width * 2) + '+')
+
+    def draw_block(self, block, offset):
+        for y, row in enumerate(block['shape']):
+            for x, cell in enumerate(row):
+                if cell != 0:
+                    self.put_cell(x + offset[0], y + offset[1], block['color'])
+
+    def draw_next_block(self, block):
+        self.put(1, self.panel_col, "Next Block:")
+        # Always fill the whole 4x4 preview so a smaller next block overwrites the previous one
+        for y in range(4):
+            for x in range(4):
+                shape = block['shape']
+                filled = y < len(shape) and x < len(shape[y]) and shape[y][x] != 0
+                attr = self.color_attr(block['color']) if filled else 0
+                self.put(3 + y, self.panel_col + 2 + x * 2, '[]' if filled else '  ', attr)
+
+    def draw_player_info(self, player_name, points, level):
+        self.put(9, self.panel_col, f"Player: {player_name}".ljust(20))
+        self.put(11, self.panel_col, f"Score: {points}".ljust(20))
+        self.put(13, self.panel_col, f"Level: {level}".ljust(20))
+
+    def display_message(self, message):
+        # Messages are rare, so draw them straight to the terminal and repaint everything on the next frame
+        lines = message.split('\n')
+        top = max(0, self.height // 2 - len(lines) // 2)
+        for i, line in enumerate(lines):
+            self.write(top + i, max(0, self.width + 1 - len(line) // 2), f" {line} ", curses.A_BOLD)
+        self.stdscr.refresh()
+        self.full_redraw = True
+
+    def present(self):
+        if self.full_redraw:
+            self.stdscr.erase()
+            self.front = {}
+            self.full_redraw = False
+        # Blank out whatever was shown last frame but is not part of this one
+        for position in self.front.keys() - self.back.keys():
+            self.write(position[0], position[1], ' ' * len(self.front[position][0]))
+        for position, cell in self.back.items():
+            if self.front.get(position) != cell:
+                self.write(position[0], position[1], cell[0], cell[1])
+        self.front = self.back
+        self.back = {}
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+    def poll_actions(self):
+        actions = []
+        while True:
+            key = self.stdscr.getch()
+            if key == -1:
+                break
+            if key == curses.KEY_RESIZE:
+                self.full_redraw = True
+                if not self.wait_for_terminal_size():
+                    actions.append('quit')
+            elif key in self.keymap:
+                actions.append(self.keymap[key])
+        return actions
+
+    def get_ticks(self):
+        return int((time.monotonic() - self.start_time) * 1000)
+
+    def tick(self, fps):
+        # Sleep away the rest of the frame instead of spinning the CPU
+        frame_time = 1 / fps
+        elapsed = time.monotonic() - self.last_frame_time
+        if elapsed < frame_time:
+            time.sleep(frame_time - elapsed)
+        self.last_frame_time = time.monotonic()
+
+    def pause(self, seconds):
+        # Drop keys pressed or auto-repeated meanwhile (e.g. a held soft drop) so they don't hit the next block or screen
+        time.sleep(seconds)
+        curses.flushinp()
+
+    def ask_player_name(self):
+        input_text = ""
+        while not input_text.strip():
+            self.stdscr.erase()
+            self.write(self.height // 2, 2, "Enter Your Name:")
+            self.stdscr.nodelay(False)
+            curses.echo()
+            try:
+                curses.curs_set(1)
+            except curses.error:
+                pass
+            input_text = self.stdscr.getstr(self.height // 2 + 2, 2, 30).decode(errors='ignore')
+            curses.noecho()
+            try:
+                curses.curs_set(0)
+            except curses.error:
+                pass
+            self.stdscr.nodelay(True)
+        self.full_redraw = True
+        return input_text
+
+    def show_level_up(self, level):
+        self.display_message(f"Level {level} reached!")
+        self.pause(2)
+
+    def show_mega_tetris(self):
+        self.display_message("Mega Tetris!")
+        self.pause(2)
+
+    def show_game_over(self, points, level, survival_time):
+        self.display_message(f"Game Over\n\nPoints: {points}\nLevel Reached: {level}\nSurvival Time: {survival_time}\n\nEsc: Play Again, Other Keys: Quit")
+        curses.flushinp()
+        self.pause(0.5)
+        self.stdscr.nodelay(False)
+        key = self.stdscr.getch()
+        self.stdscr.nodelay(True)
+        return key == 27
+
+class Tetris:
+    def __init__(self, renderer=None):
+        self.renderer = renderer if renderer is not None else PygameRenderer(GRID_WIDTH, GRID_HEIGHT)
+        self.graphical = self.renderer.graphical
         self.width = GRID_WIDTH
         self.height = GRID_HEIGHT
         self.grid = [['.' for _ in range(self.width)] for _ in range(self.height)]
         self.color_grid = [[None for _ in range(self.width)] for _ in range(self.height)]
-        self.screen_width = self.width * CELL_SIZE + 200  # Increased width for displaying next block and player info
-        self.screen_height = self.height * CELL_SIZE
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        pygame.display.set_caption('Tetris')
-        self.clock = pygame.time.Clock()
         self.speed_factor = 1.0  # Speed factor for block falling
         self.fall_interval = 500 / self.speed_factor  # milliseconds
         self.level = 0
@@ -101,23 +620,25 @@ class Tetris:
         self.hard_drops = 0
         self.highest_streak = self.load_highest_streak()
         self.current_streak = self.level  
-        self.sounds = [r"_internal\start_game.mp3", r"_internal\sound_track.mp3"]  # List of sounds to play in sequence
-        self.current_sound_index = 0
-        self.play_sound(loop=True)
-        self.menu()
+        if self.graphical:
+            self.menu()  # The menus draw on the pygame screen directly
+        else:
+            self.get_player_name()
+            self.run()
 
     def menu(self):
         menu_font = pygame.font.Font(None, 36)
         menu_options = ["Instructions", "Play", "High Scores", "Close"]
+        self.renderer.start_music()
         self.selected_option = 0
 
         while True:
-            self.screen.fill((173, 216, 230))
+            self.renderer.screen.fill((173, 216, 230))
             for i, option in enumerate(menu_options):
                 color = (255, 255, 255) if i == self.selected_option else (128, 128, 128)
                 text_surface = menu_font.render(option, True, color)
-                text_rect = text_surface.get_rect(center=(self.screen_width // 2, 200 + i * 50))
-                self.screen.blit(text_surface, text_rect)
+                text_rect = text_surface.get_rect(center=(self.renderer.screen_width // 2, 200 + i * 50))
+                self.renderer.screen.blit(text_surface, text_rect)
 
             pygame.display.flip()
 
@@ -130,16 +651,16 @@ class Tetris:
                         if menu_options[self.selected_option] == "Instructions":
                             self.display_instructions()
                         elif menu_options[self.selected_option] == "Play":
-                            self.screen.fill((173, 216, 230))
+                            self.renderer.screen.fill((173, 216, 230))
                             pygame.display.flip()
 
                             # Show a countdown for 5 seconds
                             countdown_font = pygame.font.Font(None, 72)
                             for i in range(5, 0, -1):
-                                self.screen.fill((173, 216, 230))
+                                self.renderer.screen.fill((173, 216, 230))
                                 countdown_text = countdown_font.render(str(i), True, (255, 255, 255))
-                                countdown_rect = countdown_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-                                self.screen.blit(countdown_text, countdown_rect)
+                                countdown_rect = countdown_text.get_rect(center=(self.renderer.screen_width // 2, self.renderer.screen_height // 2))
+                                self.renderer.screen.blit(countdown_text, countdown_rect)
                                 pygame.display.flip()
                                 time.sleep(1)
 
@@ -157,7 +678,7 @@ class Tetris:
                         self.selected_option = (self.selected_option + 1) % len(menu_options)
 
     def display_instructions(self):
-        instruction_font = pygame.font.Font(None, self.screen_height // 23)
+        instruction_font = pygame.font.Font(None, self.renderer.screen_height // 23)
         instructions = [
             "Instructions:",
             "- Use the LEFT and RIGHT arrow keys to move the blocks horizontally.",
@@ -174,11 +695,11 @@ class Tetris:
         ]
 
         while True:
-            self.screen.fill((173, 216, 230))
+            self.renderer.screen.fill((173, 216, 230))
             for i, line in enumerate(instructions):
                 text_surface = instruction_font.render(line, True, (128 , 128 , 128))
-                text_rect = text_surface.get_rect(center=(self.screen_width // 2, 100 + 1.25*i * 30))
-                self.screen.blit(text_surface, text_rect)
+                text_rect = text_surface.get_rect(center=(self.renderer.screen_width // 2, 100 + 1.25*i * 30))
+                self.renderer.screen.blit(text_surface, text_rect)
 
             pygame.display.flip()
 
@@ -191,60 +712,23 @@ class Tetris:
                         return
 
     def create_new_block(self):
-        self.last_fall_time = pygame.time.get_ticks()
+        self.last_fall_time = self.renderer.get_ticks()
         block = random.choice(SHAPES)
         if self.level >= 2: 
             block['color'] = ( random.randint( 1 , 254 ), random.randint( 1 , 254 ) , random.randint( 1 , 254 ) ) # Directly changed the Sequence "SHAPES" colour each time.
         return {'shape': block['shape'], 'color': block['color']}
 
     def draw_grid(self):
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.grid[y][x] == '.':
-                    # If the cell is empty, check if it contains a placed block with a color
-                    color = self.color_grid[y][x]
-                    if color is None:
-                        color = EMPTY_COLOR
-                else:
-                    color = self.color_grid[y][x] if self.color_grid[y][x] is not None else self.current_block['color']
-                pygame.draw.rect(self.screen, color, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-                pygame.draw.rect(self.screen, GRID_COLOR, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+        self.renderer.draw_grid(self.grid, self.color_grid, self.current_block['color'])
 
     def draw_block(self, block, offset):
-        for y, row in enumerate(block['shape']):
-            for x, cell in enumerate(row):
-                if cell != 0:
-                    color = block['color']
-                    pygame.draw.rect(self.screen, color, ((x + offset[0]) * CELL_SIZE, (y + offset[1]) * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        self.renderer.draw_block(block, offset)
 
     def draw_next_block(self):
-        next_block_font = pygame.font.Font(None, 24)
-        next_block_text = next_block_font.render("Next Block:", True, (255, 255, 255))
-        next_block_rect = next_block_text.get_rect(center=(self.screen_width - 97, 50))
-        self.screen.blit(next_block_text, next_block_rect)
-
-        # Draw box border around the next block
-        pygame.draw.rect(self.screen, (255, 255, 255), (self.screen_width - 162, 100, 135, 153), 2)
-
-        # Draw next block shape
-        next_block_shape = self.next_block['shape']
-        for y, row in enumerate(next_block_shape):
-            for x, cell in enumerate(row):
-                if cell != 0:
-                    color = self.next_block['color']
-                    pygame.draw.rect(self.screen, color, ((x + self.width + 1.25) * CELL_SIZE + 20, (y + 3.25) * CELL_SIZE + 20, CELL_SIZE, CELL_SIZE))
+        self.renderer.draw_next_block(self.next_block)
 
     def draw_player_info(self):
-        player_info_font = pygame.font.Font(None, 24)
-        player_name_text = player_info_font.render(f"Player: {self.player_name}", True, (255, 255, 255))
-        player_name_rect = player_name_text.get_rect(center=(self.screen_width - 100, 300))
-        self.screen.blit(player_name_text, player_name_rect)
-        player_score_text = player_info_font.render(f"Score: {self.points}", True, (255, 255, 255))
-        player_score_rect = player_score_text.get_rect(center=(self.screen_width - 100, 350))
-        self.screen.blit(player_score_text, player_score_rect)
-        level_text = player_info_font.render(f"Level: {self.level}", True, (255, 255, 255))
-        level_rect = level_text.get_rect(center=(self.screen_width - 100, 400))
-        self.screen.blit(level_text, level_rect)
+        self.renderer.draw_player_info(self.player_name, self.points, self.level)
 
     def check_collision(self, block, offset):
         for y, row in enumerate(block['shape']):
@@ -285,70 +769,7 @@ class Tetris:
 
     def check_mega_tetris(self, lines_cleared):
         if lines_cleared >= 4: 
-            self.fade_lines()
-            pygame.mixer.music.load(r"_internal\mega_tetris_sound.mp3")
-            pygame.mixer.music.play(-1)
-            self.display_message("Mega Tetris!")
-            pygame.time.wait(2000)
-            self.play_sound(loop = False)
-
-    def fade_lines(self):
-        for i in range(255, 0, -10):
-            self.screen.fill((0, 0, 0))
-            self.draw_grid()
-            alpha_surface = pygame.Surface((self.screen_width, self.screen_height))
-            alpha_surface.set_alpha(i)
-            self.screen.blit(alpha_surface, (0, 0))
-            pygame.display.flip()
-            pygame.time.delay(50)
-    
-    def display_level_up_animation(self):
-        # Create particles
-        particles = []
-        num_particles = 100
-
-        for _ in range(num_particles):
-            x = random.randint(0, self.screen_width)
-            y = random.randint(0, self.screen_height)
-            color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-            particle = Particle(x, y, color)
-            particles.append(particle)
-
-        pygame.mixer.music.load(r"_internal\level_upgrade.mp3")
-        pygame.mixer.music.play()
-
-        duration = 2000  # milliseconds
-        start_time = pygame.time.get_ticks()
-        while ( pygame.time.get_ticks() - start_time < duration ) :
-            # Update particles
-            for particle in particles:
-                particle.update()
-            # Draw particles
-            self.screen.fill((0, 0, 0))  # Clear the screen
-            for particle in particles:
-                if particle.is_alive():
-                    particle.draw(self.screen)
-            self.display_message(f"Level {self.level} reached!")
-            pygame.display.flip()
-            pygame.time.delay(20)  # Delay between frames
-
-        self.fade_lines()
-        pygame.time.wait(600)
-        self.play_sound(loop=False)
-
-    def display_message(self, message):
-        message_font = pygame.font.Font(None, 72)
-        message_text = message_font.render(message, True, (255, 255, 255))
-        message_rect = message_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-        self.screen.blit(message_text, message_rect)
-        pygame.display.flip()
-
-    def play_sound(self, loop=False):
-        pygame.mixer.music.load( self.sounds[self.current_sound_index] )
-        pygame.mixer.music.play(-1 if loop else 0)
-
-        # Increment current_sound_index for the next sound sequence
-        self.current_sound_index = (self.current_sound_index + 1) % len(self.sounds)
+            self.renderer.show_mega_tetris()
 
     def move_block(self, direction):
         new_offset = [self.offset[0] + direction[0], self.offset[1] + direction[1]]
@@ -365,74 +786,40 @@ class Tetris:
         self.current_block['shape'] = rotated_block
 
     def get_player_name(self):
-        input_font = pygame.font.Font(None, 36)
-        input_text = ""
-        while True:
-            self.screen.fill((0, 0, 0))
-            prompt_text = input_font.render("Enter Your Name:", True, (255, 255, 255))
-            prompt_rect = prompt_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            self.screen.blit(prompt_text, prompt_rect)
-
-            input_rendered = input_font.render(input_text, True, (255, 255, 255))
-            input_rect = input_rendered.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 50))
-            self.screen.blit(input_rendered, input_rect)
-
-            pygame.display.flip()
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        if input_text.strip():
-                            # Truncate player name if longer than 10 characters
-                            self.player_name = input_text.strip()[:10]
-                            return
-                    elif event.key == pygame.K_BACKSPACE:
-                        input_text = input_text[:-1]
-                    else:
-                        input_text += event.unicode
+        # Truncate player name if longer than 10 characters
+        self.player_name = self.renderer.ask_player_name().strip()[:10]
 
     def run(self):
         running = True
         highest_streak_time = 0  # Track the time for highest streak
-        start_time = pygame.time.get_ticks()  # Record start time
+        start_time = self.renderer.get_ticks()  # Record start time
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or event.type == pygame.K_ESCAPE:
+            for action in self.renderer.poll_actions():
+                if action == 'quit':
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_LEFT:
-                        self.move_block([-1, 0])
-                    elif event.key == pygame.K_RIGHT:
-                        self.move_block([1, 0])
-                    elif event.key == pygame.K_DOWN:
-                        # Increment point for each SOFT_DROP cell
-                        self.soft_drops += 1
-                        self.move_block([0, 1])
-                    elif event.key == pygame.K_UP:
-                        # Rotate block
-                        self.rotate_block()
-                    elif event.key == pygame.K_UP and (event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT):
-                        # Rotate block and move left or right simultaneously
-                        self.rotate_block()
-                        if event.key == pygame.K_LEFT:
-                            self.move_block([-1, 0])
-                        elif event.key == pygame.K_RIGHT:
-                            self.move_block([1, 0])
-                    elif event.key == pygame.K_END:
+                elif action == 'left':
+                    self.move_block([-1, 0])
+                elif action == 'right':
+                    self.move_block([1, 0])
+                elif action == 'soft_drop':
+                    # Increment point for each SOFT_DROP cell
+                    self.soft_drops += 1
+                    self.move_block([0, 1])
+                elif action == 'rotate':
+                    # Rotate block
+                    self.rotate_block()
+                elif action == 'hard_drop':
                     # Find the maximum possible downward movement for the block
-                        max_downward_movement = 0
-                        while self.move_block([0, 1]):
-                            max_downward_movement += 1
-                        # Move the block to the bottom of its column
-                        for _ in range(max_downward_movement):
-                            self.move_block([0, 1]) 
-                        self.hard_drops += max_downward_movement * 2
-                        
+                    max_downward_movement = 0
+                    while self.move_block([0, 1]):
+                        max_downward_movement += 1
+                    # Move the block to the bottom of its column
+                    for _ in range(max_downward_movement):
+                        self.move_block([0, 1]) 
+                    self.hard_drops += max_downward_movement * 2
+
             # Automatic falling of blocks
-            current_time = pygame.time.get_ticks()
+            current_time = self.renderer.get_ticks()
             if current_time - self.last_fall_time > self.fall_interval:
                 self.last_fall_time = current_time
                 lines_cleared = 0
@@ -447,10 +834,10 @@ class Tetris:
                         if self.speed_factor >= ( self.level + 2 ) :
                             self.level += 1
                             self.current_streak += 1  # Increment current streak when level increases
-                            self.display_level_up_animation() 
+                            self.renderer.show_level_up(self.level)
                     if any(cell != '.' for cell in self.grid[0]) :
                         self.game_over = True
-                        highest_streak_time = pygame.time.get_ticks() - start_time
+                        highest_streak_time = self.renderer.get_ticks() - start_time
                         # Check if level is higher than previous So streak MUST BE replaced BUT if level is same as previous BUT time takes is lower so then also run this block
                         if self.highest_streak is not None:
                             if (self.level > self.highest_streak.streak) or ( ( self.level == self.highest_streak.streak) and highest_streak_time < self.highest_streak.total_time) :
@@ -468,74 +855,24 @@ class Tetris:
                 # Check for mega tetris
                 self.check_mega_tetris(lines_cleared)
 
-            self.screen.fill((0, 0, 0))
+            self.renderer.clear()
             self.draw_grid()
             self.draw_block(self.current_block, self.offset)
             self.draw_next_block() 
             self.draw_player_info()  
-            pygame.display.flip()
-            self.clock.tick(30 * self.speed_factor)  # Adjust the clock tick based on the speed factor
+            self.renderer.present()
+            self.renderer.tick(30 * self.speed_factor)  # Adjust the clock tick based on the speed factor
 
         # pygame.quit()
         # sys.exit()
         
 
     def show_game_over_screen(self , highest_streak_time):
-        game_over_font = pygame.font.Font(None, 72)
-        game_over_text = game_over_font.render("Game Over", True, (255, 255, 255) )
-        game_over_rect = game_over_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 90))
-
-        points_font = pygame.font.Font(None, 36)
-        points_text = points_font.render(f"Points: {self.points}", True, (255, 255, 255))
-        points_rect = points_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
-
-        # Calculate survival time
-        survival_time_font = pygame.font.Font(None, 28)
-        survival_time = self.format_time(float(highest_streak_time / 1000))
-        survival_time_text = survival_time_font.render(f"Survival Time: {survival_time}", True, (255, 255, 255))
-        survival_time_rect = survival_time_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 60))
-
-        self.screen.fill(( 0 , 0 , 0 ))
-        self.screen.blit(game_over_text, game_over_rect)
-        self.screen.blit(survival_time_text, survival_time_rect) 
-        self.screen.blit(points_text, points_rect)
-        pygame.display.flip()
-        pygame.mixer.music.load(r"_internal\game_over.mp3")
-        pygame.mixer.music.play()
-
         # Save high score
         self.save_high_score()
-
-        # Display level reached
-        level_font = pygame.font.Font(None, 34)
-        level_text = level_font.render(f"Level Reached: {self.level}", True, (255, 255, 255))
-        level_rect = level_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 105))
-        self.screen.blit(level_text, level_rect)
-
-        # Wait for a while before proceeding
-        text_font = pygame.font.Font(None, 28)
-        text = text_font.render(f"Press Escape to Return to Menu.", True, (255, 255, 0 ))
-        text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 145))
-        self.screen.blit(text, text_rect)
-        pygame.display.flip()
-
-        # Wait for user input to either return to menu or exit game
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        waiting = False
-                        # self.menu()  # Go back to the menu
-                        self.__init__()  # Reinitialize the game
-                else :
-                # If the loop ends, it means the user didn't press Escape and wants to exit the game
-                    pygame.time.wait(5000)
-                    pygame.quit()
-                    sys.exit()
+        survival_time = self.format_time(float(highest_streak_time / 1000))
+        if self.renderer.show_game_over(self.points, self.level, survival_time):
+            self.__init__(self.renderer)  # Reinitialize the game
 
     def load_highest_streak(self):
         try:
@@ -600,26 +937,26 @@ class Tetris:
     def display_high_scores(self):
         high_score_font = pygame.font.Font(None, 36)
         title_text = high_score_font.render("High Scores", True, ( 0 , 0 , 0 ))
-        title_rect = title_text.get_rect(center=(self.screen_width // 2, 50))
-        self.screen.fill((173, 216, 230))
-        self.screen.blit(title_text, title_rect)
+        title_rect = title_text.get_rect(center=(self.renderer.screen_width // 2, 50))
+        self.renderer.screen.fill((173, 216, 230))
+        self.renderer.screen.blit(title_text, title_rect)
 
         # Display headers
         headers = ['Rank', 'Date', 'Player', 'Score']
         total_width = len(headers) * 150  # Total width of all headers
-        start_x = ( (self.screen_width - total_width) // 2 ) - 7.5
+        start_x = ( (self.renderer.screen_width - total_width) // 2 ) - 7.5
 
         for i, header in enumerate(headers):
             header_text = high_score_font.render(header, True, ( 28 , 128 , 128 ))
             header_rect = header_text.get_rect(center=(start_x + (i * 150) + 75, 100))  
-            self.screen.blit(header_text, header_rect)
+            self.renderer.screen.blit(header_text, header_rect)
 
         line_height = 40
         high_score_font = pygame.font.Font(None, 26)
         # Display high scores
         for i, score in enumerate(self.high_scores):
             for j, data in enumerate(score):
-                column_width = self.screen_width // len(score)
+                column_width = self.renderer.screen_width // len(score)
                 x_position = (column_width * j) + (column_width // 2)
                 y_position = 150 + i * line_height
                 
@@ -628,19 +965,19 @@ class Tetris:
                     data = data[:10] if len(data) > 10 else data
                 score_text = high_score_font.render(data, True, ( 28 , 128 , 128 ))
                 score_rect = score_text.get_rect(center=(x_position, y_position))
-                self.screen.blit(score_text, score_rect)
+                self.renderer.screen.blit(score_text, score_rect)
 
         # Display highest streak information
         if self.highest_streak :
             high_streak_font = pygame.font.Font( None , 23 )
             total_formatted_time = self.format_time(float(self.highest_streak.total_time / 1000))
             highest_streak_text = high_streak_font.render(f"Best Streak :- \"{self.highest_streak.username}\" reached in {self.highest_streak.streak} levels, taking time ({total_formatted_time}).", True, ( 0 , 0 , 0 ) )
-            highest_streak_rect = highest_streak_text.get_rect(center=(self.screen_width // 2, 530))
-            self.screen.blit(highest_streak_text, highest_streak_rect)
+            highest_streak_rect = highest_streak_text.get_rect(center=(self.renderer.screen_width // 2, 530))
+            self.renderer.screen.blit(highest_streak_text, highest_streak_rect)
         else:
             highest_streak_text = high_score_font.render("Highest Streak: None", True, (255, 255, 255))
-            highest_streak_rect = highest_streak_text.get_rect(center=(self.screen_width // 2, 550))
-            self.screen.blit(highest_streak_text, highest_streak_rect)
+            highest_streak_rect = highest_streak_text.get_rect(center=(self.renderer.screen_width // 2, 550))
+            self.renderer.screen.blit(highest_streak_text, highest_streak_rect)
 
         pygame.display.flip()
         while True:
@@ -653,4 +990,10 @@ class Tetris:
                         return
 
 if __name__ == "__main__":
-    tetris_game = Tetris()
\ No newline at end of file
+    if "--curses" in sys.argv[1:]:
+        # Play inside the terminal, e.g. over SSH or without an SDL video driver
+        if curses is None:
+            sys.exit("The curses module is not available on this platform.")
+        curses.wrapper(lambda stdscr: Tetris(CursesRenderer(stdscr, GRID_WIDTH, GRID_HEIGHT)))
+    else:
+        tetris_game = Tetris()
\ No newline at end of file